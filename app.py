@@ -6,10 +6,21 @@ Supports local dev (credentials.json) and Render deployment (GOOGLE_CREDENTIALS
 
 import os
 import json
-from datetime import datetime
-from flask import Flask, request, jsonify, render_template
+import atexit
+import hashlib
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache
+from flask import Flask, Response, request, render_template
 import gspread
+import orjson
+from google.auth.transport.requests import AuthorizedSession
 from google.oauth2.service_account import Credentials
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # ── Config ──────────────────────────────────────────────────────────────────
 SCOPES = [
@@ -41,27 +52,127 @@ JOBLIST_HEADERS = [
 app = Flask(__name__)
 
 
+def read_json():
+    """Parse the request body as JSON."""
+    return orjson.loads(request.get_data())
+
+
+def json_response(payload, status=200):
+    """Encode a JSON response with orjson."""
+    return Response(orjson.dumps(payload), status=status, mimetype="application/json")
+
+
 # ── Google Sheets Connection ────────────────────────────────────────────────
-def get_sheet():
-    """Authenticate and return the spreadsheet object.
+# Re-authorize periodically so a long-lived worker never holds a stale client.
+CLIENT_REFRESH_SECONDS = 30 * 60
+
+# Keep-alive pool sized for gunicorn's threads plus the background writer
+HTTP_POOL_MAXSIZE = 32
+
+_CLIENT = None
+_CLIENT_CREATED = 0.0
+_SPREADSHEETS = {}
+_WORKSHEETS = {}
+_CLIENT_LOCK = threading.Lock()
+_REFRESH_LOCK = threading.Lock()
+
+
+def _load_credentials():
+    """Build service account credentials.
     Uses GOOGLE_CREDENTIALS env var (Render) or falls back to credentials.json (local).
     """
     env_creds = os.environ.get("GOOGLE_CREDENTIALS")
     if env_creds:
         info = json.loads(env_creds)
-        creds = Credentials.from_service_account_info(info, scopes=SCOPES)
-    else:
-        creds_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "credentials.json")
-        creds = Credentials.from_service_account_file(creds_file, scopes=SCOPES)
-    client = gspread.authorize(creds)
-    return client.open_by_key(SPREADSHEET_ID)
+        return Credentials.from_service_account_info(info, scopes=SCOPES)
+    creds_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "credentials.json")
+    return Credentials.from_service_account_file(creds_file, scopes=SCOPES)
+
+
+def _connect():
+    """Authorize a gspread client.
+    The session keeps enough pooled connections that concurrent requests reuse
+    TLS connections, and retries only 429s (a rejected request is safe to
+    resend) a bounded number of times.
+    """
+    creds = _load_credentials()
+    retry = Retry(
+        total=3, connect=0, read=0, other=0, status=3,
+        status_forcelist=(429,), allowed_methods=None,
+        backoff_factor=1, raise_on_status=False,
+    )
+    session = AuthorizedSession(creds)
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=retry),
+    )
+    return gspread.Client(creds, session=session)
+
+
+def _get_client():
+    """Return the cached client, re-authorizing once it is too old.
+    Only one thread rebuilds it; the others keep using the old client until
+    the new one is swapped in, and no network call runs under _CLIENT_LOCK.
+    """
+    global _CLIENT, _CLIENT_CREATED
+    with _CLIENT_LOCK:
+        client, created = _CLIENT, _CLIENT_CREATED
+    if client is not None and time.monotonic() - created <= CLIENT_REFRESH_SECONDS:
+        return client
+    if not _REFRESH_LOCK.acquire(blocking=client is None):
+        return client
+
+    old = None
+    try:
+        with _CLIENT_LOCK:
+            if _CLIENT is not client:
+                # Another thread refreshed while we waited
+                return _CLIENT
+        new = _connect()
+        with _CLIENT_LOCK:
+            old = _CLIENT
+            _CLIENT = new
+            _CLIENT_CREATED = time.monotonic()
+            _SPREADSHEETS.clear()
+            _WORKSHEETS.clear()
+    finally:
+        _REFRESH_LOCK.release()
+    if old is not None:
+        old.http_client.session.close()
+    return new
+
+
+def open_spreadsheet(spreadsheet_id):
+    """Return a cached spreadsheet handle, authorizing once per process."""
+    client = _get_client()
+    with _CLIENT_LOCK:
+        spreadsheet = _SPREADSHEETS.get(spreadsheet_id)
+    if spreadsheet is None:
+        spreadsheet = client.open_by_key(spreadsheet_id)
+        with _CLIENT_LOCK:
+            # Only cache handles opened with the current client
+            if client is _CLIENT:
+                spreadsheet = _SPREADSHEETS.setdefault(spreadsheet_id, spreadsheet)
+    return spreadsheet
+
+
+def get_sheet():
+    """Return the main business spreadsheet."""
+    return open_spreadsheet(SPREADSHEET_ID)
 
 
 def get_or_create_worksheet(spreadsheet, tab_name, headers):
-    """Get a worksheet by name, creating it with headers if it doesn't exist."""
+    """Get a worksheet by name, creating it with headers if it doesn't exist.
+    Handles are cached per process so repeat lookups skip the metadata fetch.
+    """
+    key = (spreadsheet.id, tab_name)
+    ws = _WORKSHEETS.get(key)
+    if ws is not None:
+        return ws
+
     try:
         ws = spreadsheet.worksheet(tab_name)
-    except Exception:
+    except gspread.WorksheetNotFound:
         try:
             ws = spreadsheet.add_worksheet(title=tab_name, rows=1000, cols=len(headers))
             ws.append_row(headers, value_input_option="USER_ENTERED")
@@ -69,11 +180,202 @@ def get_or_create_worksheet(spreadsheet, tab_name, headers):
             # Tab exists but wasn't found by name — try fetching all worksheets
             for sheet in spreadsheet.worksheets():
                 if sheet.title.strip().lower() == tab_name.strip().lower():
-                    return sheet
-            raise
+                    ws = sheet
+                    break
+            else:
+                raise
+    _WORKSHEETS[key] = ws
     return ws
 
 
+def _is_missing_tab(error):
+    """True if a Sheets error means the tab was renamed or deleted."""
+    if isinstance(error, gspread.WorksheetNotFound):
+        return True
+    return error.response.status_code in (400, 404)
+
+
+def with_worksheet(spreadsheet, tab_name, headers, action):
+    """Call action(ws) for a tab, recovering from a stale cached handle.
+    If the tab behind a cached handle has gone away, the handle is evicted and
+    the lookup (re-creating the tab if needed) is retried once.
+    """
+    key = (spreadsheet.id, tab_name)
+    cached = key in _WORKSHEETS
+    ws = get_or_create_worksheet(spreadsheet, tab_name, headers)
+    try:
+        return action(ws)
+    except (gspread.WorksheetNotFound, gspread.exceptions.APIError) as e:
+        if not cached or not _is_missing_tab(e):
+            raise
+        _WORKSHEETS.pop(key, None)
+        return action(get_or_create_worksheet(spreadsheet, tab_name, headers))
+
+
+def read_records(tab_name, headers):
+    """Return a tab's data rows as dicts keyed by its header row.
+    Reads the whole tab with a single values.get call; short rows are padded
+    so every record has every column.
+    """
+    spreadsheet = get_sheet()
+    values = with_worksheet(
+        spreadsheet, tab_name, headers,
+        lambda ws: spreadsheet.values_get(f"'{ws.title}'"),
+    ).get("values", [])
+    if not values:
+        return []
+    header_row = values[0]
+    width = len(header_row)
+    return [dict(zip(header_row, row + [""] * (width - len(row)))) for row in values[1:]]
+
+
+# ── Read Cache ──────────────────────────────────────────────────────────────
+# GET payloads are kept as encoded JSON for a few seconds and dropped as soon
+# as this process writes to the tab. Other gunicorn workers don't see that
+# invalidation, so the UI asks for ?fresh=1 when reloading after its own write.
+READ_CACHE_SECONDS = 15
+
+_READ_CACHE = {}
+_READ_GENERATIONS = {}
+_READ_CACHE_LOCK = threading.Lock()
+
+
+def cached_records_response(tab_name, headers, key):
+    """Serve a tab's records as JSON, from cache when fresh.
+    Responses carry an ETag so the browser can revalidate with a 304.
+    """
+    now = time.monotonic()
+    with _READ_CACHE_LOCK:
+        entry = _READ_CACHE.get(tab_name)
+        generation = _READ_GENERATIONS.get(tab_name, 0)
+    if entry is None or entry[0] <= now or request.args.get("fresh") == "1":
+        records = read_records(tab_name, headers)
+        body = orjson.dumps({"success": True, key: records})
+        entry = (now + READ_CACHE_SECONDS, body, hashlib.sha1(body).hexdigest())
+        with _READ_CACHE_LOCK:
+            # Skip storing if a write invalidated the tab while we were reading
+            if _READ_GENERATIONS.get(tab_name, 0) == generation:
+                _READ_CACHE[tab_name] = entry
+
+    response = Response(entry[1], mimetype="application/json")
+    response.set_etag(entry[2])
+    # Always revalidate: the client reloads right after its own writes
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+def invalidate_records(tab_name):
+    """Drop the cached GET payload for a tab."""
+    with _READ_CACHE_LOCK:
+        _READ_CACHE.pop(tab_name, None)
+        _READ_GENERATIONS[tab_name] = _READ_GENERATIONS.get(tab_name, 0) + 1
+
+
+# ── Background Writer ──────────────────────────────────────────────────────
+# Appends are queued and flushed by a background thread, one append_rows call
+# per tab, so POST routes never wait on Google's API.
+FLUSH_INTERVAL = 0.5   # seconds to keep collecting rows after the first one
+FLUSH_MAX_ROWS = 50
+WRITE_RETRY_DELAY = 2  # seconds before retrying a rate-limited append once
+SHUTDOWN_TIMEOUT = 20  # seconds to let the writer finish on exit
+
+_WRITE_Q = queue.Queue()
+_WRITER = None
+_WRITER_LOCK = threading.Lock()
+_STOP = object()
+
+
+def queue_row(spreadsheet_id, tab_name, headers, row):
+    """Queue a row to be appended to a tab by the background writer."""
+    global _WRITER
+    with _WRITER_LOCK:
+        # Started lazily so each gunicorn worker gets its own thread after fork
+        if _WRITER is None or not _WRITER.is_alive():
+            _WRITER = threading.Thread(target=_write_loop, name="sheets-writer", daemon=True)
+            _WRITER.start()
+    _WRITE_Q.put((spreadsheet_id, tab_name, headers, row))
+
+
+def _write_loop():
+    while True:
+        item = _WRITE_Q.get()
+        if item is _STOP:
+            return
+        batch = [item]
+        stopping = False
+        deadline = time.monotonic() + FLUSH_INTERVAL
+        while len(batch) < FLUSH_MAX_ROWS:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = _WRITE_Q.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                stopping = True
+                break
+            batch.append(item)
+        _write_batch(batch)
+        if stopping:
+            return
+
+
+def _write_batch(batch):
+    """Append queued rows, grouped into one request per tab."""
+    groups = {}
+    for spreadsheet_id, tab_name, headers, row in batch:
+        key = (spreadsheet_id, tab_name)
+        if key not in groups:
+            groups[key] = (headers, [])
+        groups[key][1].append(row)
+
+    for (spreadsheet_id, tab_name), (headers, rows) in groups.items():
+        for attempt in range(2):
+            try:
+                with_worksheet(
+                    open_spreadsheet(spreadsheet_id), tab_name, headers,
+                    lambda ws: ws.append_rows(rows, value_input_option="USER_ENTERED"),
+                )
+                invalidate_records(tab_name)
+                break
+            except Exception as e:
+                # Only a 429 guarantees nothing was written; any other failure
+                # may have reached Google, and resending could duplicate rows.
+                if attempt == 0 and _is_rate_limited(e):
+                    app.logger.warning("Write to %s rate limited, retrying", tab_name)
+                    time.sleep(WRITE_RETRY_DELAY)
+                    continue
+                _log_unwritten(spreadsheet_id, tab_name, rows)
+                break
+
+
+def _is_rate_limited(error):
+    return (
+        isinstance(error, gspread.exceptions.APIError)
+        and error.response.status_code == 429
+    )
+
+
+def _log_unwritten(spreadsheet_id, tab_name, rows):
+    """Log rows that couldn't be written as one JSON line for replaying."""
+    app.logger.exception(
+        "Failed to write %d row(s) to %s; unwritten: %s",
+        len(rows), tab_name,
+        orjson.dumps({"spreadsheet_id": spreadsheet_id, "tab": tab_name, "rows": rows}).decode(),
+    )
+
+
+@atexit.register
+def _stop_writer():
+    """Let the writer flush its current batch and the queue before exit."""
+    writer = _WRITER
+    if writer is None or not writer.is_alive():
+        return
+    _WRITE_Q.put(_STOP)
+    writer.join(SHUTDOWN_TIMEOUT)
+
+
 # ── Header Definitions ──────────────────────────────────────────────────────
 INQUIRY_HEADERS = [
     "Timestamp", "Customer Name", "Phone", "Email", "Address",
@@ -95,56 +397,71 @@ PIPELINE_HEADERS = [
 ]
 
 
+# ── Date Helpers ────────────────────────────────────────────────────────────
+@lru_cache(maxsize=2)
+def _format_mdy(day_ordinal):
+    return date.fromordinal(day_ordinal).strftime("%m/%d/%Y")
+
+
+def today_mdy():
+    """Today's date as MM/DD/YYYY, formatted once per day."""
+    return _format_mdy(date.today().toordinal())
+
+
 # ── Joblist Writer ─────────────────────────────────────────────────────────
-def append_to_joblist(**kwargs):
-    """Append a row to the Joblist tab on the Job Tracker spreadsheet.
-    Matches the Job Tracker column order (A-U).
-    """
-    env_creds = os.environ.get("GOOGLE_CREDENTIALS")
-    if env_creds:
-        info = json.loads(env_creds)
-        creds = Credentials.from_service_account_info(info, scopes=SCOPES)
-    else:
-        creds_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "credentials.json")
-        creds = Credentials.from_service_account_file(creds_file, scopes=SCOPES)
-    client = gspread.authorize(creds)
-    jt_sheet = client.open_by_key(JOBTRACKER_SPREADSHEET_ID)
-    ws = get_or_create_worksheet(jt_sheet, TAB_JOBLIST, JOBLIST_HEADERS)
-    today = datetime.now().strftime("%m/%d/%Y")
-
-    labor_days = kwargs.get("labor_days", "")
+# Keyword argument and default for each caller-settable Joblist column (A-Q).
+# Date Added and Last Updated default to today; R-U are filled in per call.
+JOBLIST_FIELDS = (
+    ("address", ""),              # A: Job Address
+    ("int_ext", ""),              # B: Interior/Exterior
+    ("status", ""),               # C: Status
+    ("priority", ""),             # D: Priority
+    ("labor_days", ""),           # E: Labor Days
+    ("action", ""),               # F: Action Needed
+    ("notes", ""),                # G: Notes
+    ("start_date", ""),           # H: Start Date
+    ("completion_date", ""),      # I: Completion Date
+    ("hood", ""),                 # J: Hood
+    ("customer_name", ""),        # K: Customer Name
+    ("phone", ""),                # L: Phone
+    ("email", ""),                # M: Email
+    ("date_added", ""),           # N: Date Added
+    ("last_updated", ""),         # O: Last Updated
+    ("est_complete", ""),         # P: Estimate Complete
+    ("estimator", ""),            # Q: Estimator
+)
+
+
+def build_joblist_row(**kwargs):
+    """Build a Joblist row matching the Job Tracker column order (A-U)."""
+    row = [kwargs.get(key, default) for key, default in JOBLIST_FIELDS]
+
+    today = today_mdy()
+    if "date_added" not in kwargs:
+        row[13] = today
+    if "last_updated" not in kwargs:
+        row[14] = today
+
+    labor_days = row[4]
     est_value = ""
-    if labor_days and str(labor_days).strip():
+    if isinstance(labor_days, (int, float)):
+        # JSON numbers arrive already typed — no string round-trip needed
+        if labor_days:
+            est_value = labor_days * LABOR_RATE
+    elif isinstance(labor_days, str) and labor_days.strip():
         try:
             est_value = float(labor_days) * LABOR_RATE
-        except (ValueError, TypeError):
+        except ValueError:
             pass
 
-    row = [
-        kwargs.get("address", ""),           # A: Job Address
-        kwargs.get("int_ext", ""),            # B: Interior/Exterior
-        kwargs.get("status", ""),             # C: Status
-        kwargs.get("priority", ""),           # D: Priority
-        labor_days,                           # E: Labor Days
-        kwargs.get("action", ""),             # F: Action Needed
-        kwargs.get("notes", ""),              # G: Notes
-        kwargs.get("start_date", ""),         # H: Start Date
-        kwargs.get("completion_date", ""),    # I: Completion Date
-        kwargs.get("hood", ""),               # J: Hood
-        kwargs.get("customer_name", ""),      # K: Customer Name
-        kwargs.get("phone", ""),              # L: Phone
-        kwargs.get("email", ""),              # M: Email
-        kwargs.get("date_added", today),      # N: Date Added
-        kwargs.get("last_updated", today),    # O: Last Updated
-        kwargs.get("est_complete", ""),       # P: Estimate Complete
-        kwargs.get("estimator", ""),          # Q: Estimator
-        est_value,                            # R: Estimated Value
-        "",                                   # S: Days Since Est Sent (formula)
-        "",                                   # T: Priority Sort (formula)
-        "",                                   # U: Status Sort (formula)
-    ]
-
-    ws.append_row(row, value_input_option="USER_ENTERED")
+    # R: Estimated Value, then S-U are sheet formulas and stay blank
+    row += [est_value, "", "", ""]
+    return row
+
+
+def append_to_joblist(**kwargs):
+    """Queue a row for the Joblist tab on the Job Tracker spreadsheet."""
+    queue_row(JOBTRACKER_SPREADSHEET_ID, TAB_JOBLIST, JOBLIST_HEADERS, build_joblist_row(**kwargs))
 
 
 # ── Index Route ─────────────────────────────────────────────────────────────
@@ -157,9 +474,7 @@ def index():
 @app.route("/api/inquiry", methods=["POST"])
 def save_inquiry():
     try:
-        data = request.json
-        spreadsheet = get_sheet()
-        ws = get_or_create_worksheet(spreadsheet, TAB_INQUIRIES, INQUIRY_HEADERS)
+        data = read_json()
 
         row = [
             data.get("timestamp", datetime.now().isoformat()),
@@ -175,7 +490,7 @@ def save_inquiry():
             data.get("status", "New"),
         ]
 
-        ws.append_row(row, value_input_option="USER_ENTERED")
+        queue_row(SPREADSHEET_ID, TAB_INQUIRIES, INQUIRY_HEADERS, row)
 
         # Also add to Joblist tab (Job Tracker spreadsheet)
         append_to_joblist(
@@ -189,34 +504,29 @@ def save_inquiry():
             int_ext=", ".join(data.get("jobTypes", [])),
         )
 
-        return jsonify({"success": True, "message": "Inquiry saved to Google Sheets"})
+        return json_response({"success": True, "message": "Inquiry queued for Google Sheets"}, 202)
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+        return json_response({"success": False, "error": str(e)}, 500)
 
 
 # ── API: Customer Inquiries (GET) ──────────────────────────────────────
 @app.route("/api/inquiries", methods=["GET"])
 def get_inquiries():
     try:
-        spreadsheet = get_sheet()
-        ws = get_or_create_worksheet(spreadsheet, TAB_INQUIRIES, INQUIRY_HEADERS)
-        records = ws.get_all_records()
-        return jsonify({"success": True, "inquiries": records})
+        return cached_records_response(TAB_INQUIRIES, INQUIRY_HEADERS, "inquiries")
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+        return json_response({"success": False, "error": str(e)}, 500)
 
 
 # ── API: Estimates ──────────────────────────────────────────────────────────
 @app.route("/api/estimate", methods=["POST"])
 def save_estimate():
     try:
-        data = request.json
-        spreadsheet = get_sheet()
-        ws = get_or_create_worksheet(spreadsheet, TAB_ESTIMATES, ESTIMATE_HEADERS)
+        data = read_json()
 
         conditions = data.get("conditions", {})
         row = [
-            data.get("date", datetime.now().strftime("%m/%d/%Y")),
+            data.get("date", today_mdy()),
             data.get("customerName", ""),
             data.get("jobAddress", ""),
             data.get("estimator", ""),
@@ -232,7 +542,7 @@ def save_estimate():
             data.get("notes", ""),
         ]
 
-        ws.append_row(row, value_input_option="USER_ENTERED")
+        queue_row(SPREADSHEET_ID, TAB_ESTIMATES, ESTIMATE_HEADERS, row)
 
         # Also add to Joblist tab (Job Tracker spreadsheet)
         append_to_joblist(
@@ -247,33 +557,27 @@ def save_estimate():
             est_complete="Yes",
         )
 
-        return jsonify({"success": True, "message": "Estimate saved to Google Sheets"})
+        return json_response({"success": True, "message": "Estimate queued for Google Sheets"}, 202)
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+        return json_response({"success": False, "error": str(e)}, 500)
 
 
 # ── API: Job Pipeline ──────────────────────────────────────────────────────
 @app.route("/api/jobs", methods=["GET"])
 def get_jobs():
     try:
-        spreadsheet = get_sheet()
-        ws = get_or_create_worksheet(spreadsheet, TAB_PIPELINE, PIPELINE_HEADERS)
-
-        records = ws.get_all_records()
-        return jsonify({"success": True, "jobs": records})
+        return cached_records_response(TAB_PIPELINE, PIPELINE_HEADERS, "jobs")
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+        return json_response({"success": False, "error": str(e)}, 500)
 
 
 @app.route("/api/job", methods=["POST"])
 def add_job():
     try:
-        data = request.json
-        spreadsheet = get_sheet()
-        ws = get_or_create_worksheet(spreadsheet, TAB_PIPELINE, PIPELINE_HEADERS)
+        data = read_json()
 
         row = [
-            data.get("dateAdded", datetime.now().strftime("%m/%d/%Y")),
+            data.get("dateAdded", today_mdy()),
             data.get("customerName", ""),
             data.get("address", ""),
             data.get("phone", ""),
@@ -286,31 +590,37 @@ def add_job():
             data.get("notes", ""),
         ]
 
-        ws.append_row(row, value_input_option="USER_ENTERED")
+        queue_row(SPREADSHEET_ID, TAB_PIPELINE, PIPELINE_HEADERS, row)
 
-        return jsonify({"success": True, "message": "Job added to pipeline"})
+        return json_response({"success": True, "message": "Job queued for pipeline"}, 202)
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+        return json_response({"success": False, "error": str(e)}, 500)
 
 
 @app.route("/api/job/<int:row_index>", methods=["PUT"])
 def update_job(row_index):
     """Update a job's status. row_index is 2-based (row 2 = first data row)."""
     try:
-        data = request.json
-        spreadsheet = get_sheet()
-        ws = get_or_create_worksheet(spreadsheet, TAB_PIPELINE, PIPELINE_HEADERS)
+        data = read_json()
 
+        # Columns H, I, K — sent as a single batch request
+        updates = []
         if "status" in data:
-            ws.update_cell(row_index, 8, data["status"])
+            updates.append({"range": f"H{row_index}", "values": [[data["status"]]]})
         if "scheduledDate" in data:
-            ws.update_cell(row_index, 9, data["scheduledDate"])
+            updates.append({"range": f"I{row_index}", "values": [[data["scheduledDate"]]]})
         if "notes" in data:
-            ws.update_cell(row_index, 11, data["notes"])
-
-        return jsonify({"success": True, "message": "Job updated"})
+            updates.append({"range": f"K{row_index}", "values": [[data["notes"]]]})
+        if updates:
+            with_worksheet(
+                get_sheet(), TAB_PIPELINE, PIPELINE_HEADERS,
+                lambda ws: ws.batch_update(updates, value_input_option="USER_ENTERED"),
+            )
+            invalidate_records(TAB_PIPELINE)
+
+        return json_response({"success": True, "message": "Job updated"})
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+        return json_response({"success": False, "error": str(e)}, 500)
 
 
 # ── API: Setup (one-time) ──────────────────────────────────────────────────
@@ -319,17 +629,22 @@ def setup_sheets():
     """One-time setup: create all three tabs with headers."""
     try:
         spreadsheet = get_sheet()
-        get_or_create_worksheet(spreadsheet, TAB_INQUIRIES, INQUIRY_HEADERS)
-        get_or_create_worksheet(spreadsheet, TAB_ESTIMATES, ESTIMATE_HEADERS)
-        get_or_create_worksheet(spreadsheet, TAB_PIPELINE, PIPELINE_HEADERS)
+        tabs = [
+            (TAB_INQUIRIES, INQUIRY_HEADERS),
+            (TAB_ESTIMATES, ESTIMATE_HEADERS),
+            (TAB_PIPELINE, PIPELINE_HEADERS),
+        ]
+        # Independent lookups — run them side by side
+        with ThreadPoolExecutor(max_workers=len(tabs)) as pool:
+            list(pool.map(lambda tab: get_or_create_worksheet(spreadsheet, *tab), tabs))
 
-        return jsonify({
+        return json_response({
             "success": True,
             "message": "All three tabs created with headers!",
             "tabs": [TAB_INQUIRIES, TAB_ESTIMATES, TAB_PIPELINE]
         })
     except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+        return json_response({"success": False, "error": str(e)}, 500)
 
 
 # ── Main ────────────────────────────────────────────────────────────────────
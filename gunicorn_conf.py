@@ -0,0 +1,15 @@
+"""
+Gunicorn settings for production.
+Threaded workers let blocking Google Sheets calls overlap instead of
+queueing behind one another.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+worker_class = "gthread"
+# Each worker has its own Sheets client, write queue and read cache, so keep
+# the process count small and get concurrency from threads.
+workers = int(os.environ.get("WEB_CONCURRENCY", 2))
+threads = int(os.environ.get("GUNICORN_THREADS", 16))
+timeout = 30